@@ -6,27 +6,127 @@ import logging
 from git import Repo
 import sys
 import time
+import itertools
+import shutil
+import io
+import html
+from string import Template
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Changed-file lists longer than this are split across parallel snyk processes
+SHARD_THRESHOLD = 16
+
+OUTPUT_DIR = Path("outputs")
+
+# Base snyk commands for each scan type
+SAST_COMMAND = ('snyk', 'code', 'test', '--json')
+SCA_COMMAND = ('snyk', 'test', '--json')
+
+# Map SARIF levels (snyk code test) and SCA severities (snyk test) to summary buckets; anything else counts as high
+LEVEL_MAP = {'note': 'low', 'info': 'low', 'warning': 'medium'}
+SEVERITY_MAP = {'low': 'low', 'medium': 'medium'}
+
+HTML_REPORT_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Snyk scan results</title></head>
+<body>
+<h1>Snyk scan results</h1>
+<p>High: $high, Medium: $medium, Low: $low</p>
+<table border="1">
+<tr><th>Severity</th><th>Issue</th><th>Location</th><th>Details</th></tr>
+$rows</table>
+</body>
+</html>
+""")
+
+# The resolved snyk --version is cached per binary for this many seconds
+SNYK_VERSION_CACHE_FILE = Path.home() / '.cache' / 'ekart_snyk_version'
+SNYK_VERSION_CACHE_TTL = 24 * 60 * 60
+
+
+def _json_loads(data):
+    """
+    Parse JSON from bytes or str, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """
+    Serialize an object to indented JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 class SnykScanner: 
     
+    @staticmethod
+    def _read_snyk_version_cache(snyk_path, snyk_mtime):
+        """
+        Return the cached Snyk CLI version if it belongs to the same, unmodified binary.
+        A missing or malformed cache entry is treated as a cache miss.
+        """
+        try:
+            cache = _json_loads(SNYK_VERSION_CACHE_FILE.read_bytes())
+            if not isinstance(cache, dict):
+                return None
+            version = cache.get('version')
+            if (isinstance(version, str) and cache.get('path') == snyk_path and cache.get('mtime') == snyk_mtime
+                    and time.time() - cache.get('checked_at', 0) < SNYK_VERSION_CACHE_TTL):
+                return version
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+        return None
+
+    @staticmethod
+    def _write_snyk_version_cache(snyk_path, snyk_mtime, version):
+        """
+        Remember the Snyk CLI version for the given binary.
+        """
+        try:
+            SNYK_VERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            SNYK_VERSION_CACHE_FILE.write_bytes(_json_dumps(
+                {'path': snyk_path, 'mtime': snyk_mtime, 'version': version, 'checked_at': time.time()}))
+        except OSError as e:
+            logger.warning(f"Could not cache Snyk CLI version: {e}")
+
     @staticmethod
     def check_snyk_installed():
         """
         Check if Snyk CLI is installed.
+        The version check is skipped while the cached result for the same binary is still fresh.
         """
         try:
-            logger.info("----------------check_snyk_installed started-----------------")
-            result = subprocess.run(['snyk', '--version'], capture_output=True, text=True)
+            snyk_path = shutil.which('snyk')
+            snyk_mtime = os.stat(snyk_path).st_mtime if snyk_path else None
+            if snyk_path:
+                version = SnykScanner._read_snyk_version_cache(snyk_path, snyk_mtime)
+                if version:
+                    logger.info(f"Snyk CLI is installed: {version} (cached)")
+                    return
+            result = subprocess.run(['snyk', '--version'], capture_output=True)
             result.check_returncode()
-            logger.info(f"Snyk CLI is installed: {result.stdout.strip()}")
-            logger.info("----------------check_snyk_installed Ended-----------------")
+            version = result.stdout[:80].decode('ascii', 'replace').strip()
+            logger.info(f"Snyk CLI is installed: {version}")
+            if snyk_path:
+                SnykScanner._write_snyk_version_cache(snyk_path, snyk_mtime, version)
         except subprocess.CalledProcessError:
             logger.error("Snyk CLI is not installed. Please install it from https://snyk.io/docs/snyk-cli-installation/")
-            logger.info("----------------check_snyk_installed Ended-----------------")
             raise
 
     @staticmethod
@@ -35,43 +135,110 @@ class SnykScanner:
         Check auth token from environment variable.
         """
         try:
-            logger.info("----------------check_snyk_token Started-----------------")
             if 'SNYK_TOKEN' in os.environ:
                 logger.error("SNYK_TOKEN environment variable not set.")
                 raise ValueError("SNYK_TOKEN environment variable not set.")
             subprocess.run(['snyk', 'auth', token], check=True)
             logger.info("Authenticated to Snyk successfully.")
-            logger.info("----------------check_snyk_token Ended-----------------")
         except subprocess.CalledProcessError as e:
              logger.error(f"Failed to authenticate to Snyk: {e}")
-             logger.info("----------------check_snyk_token Ended-----------------")
              raise
 
-    def trigger_sast_scan(self, target, project_name=None, target_name=None):
+    @staticmethod
+    def _run_snyk_chunk(base_command, files):
         """
-        Trigger SAST scan using Snyk CLI.
+        Run a single snyk invocation for a chunk of changed files.
+        :param base_command: Snyk command without the file flags.
+        :param files: List of changed files to be scanned.
+        :return: Scan results in JSON format.
+        :raises subprocess.CalledProcessError: If the chunk was not scanned (exit code other than 0 or 1).
+        """
+        command = [*base_command, *(f"--file={file}" for file in files)]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Running Command - {command}")
+        result = subprocess.run(command, capture_output=True)
+        if result.returncode not in (0, 1):
+            # A failed chunk has no findings in its output, merging it would hide unscanned files
+            logger.error(f"CLI scan failed for chunk with error code: {result.returncode}")
+            raise subprocess.CalledProcessError(result.returncode, command, result.stdout, result.stderr)
+        return _json_loads(result.stdout)
+
+    @staticmethod
+    def _finding_key(result):
+        """
+        Identify a SARIF finding by its rule and first location.
+        """
+        location = (result.get('locations') or [{}])[0].get('physicalLocation', {})
+        region = location.get('region', {})
+        return (result.get('ruleId'), location.get('artifactLocation', {}).get('uri'),
+                region.get('startLine'), region.get('startColumn'))
+
+    def _run_sharded_scan(self, base_command, files):
+        """
+        Split the changed files into chunks and scan them with parallel snyk processes.
+        :param base_command: Snyk command without the file flags.
+        :param files: List of changed files to be scanned.
+        :return: Merged scan results in JSON format.
+        """
+        shard_count = min(os.cpu_count() or 1, -(-len(files) // SHARD_THRESHOLD))
+        shard_size = -(-len(files) // shard_count)
+        shards = [files[i:i + shard_size] for i in range(0, len(files), shard_size)]
+        logger.info(f"Splitting {len(files)} changed files into {len(shards)} shards.")
+        # Each worker only waits on its own snyk process, so threads are enough here
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(lambda shard: self._run_snyk_chunk(base_command, shard), shards))
+
+        merged = dict(results[0])
+        merged['runs'] = []
+        seen = set()
+        for run in itertools.chain.from_iterable(r.get('runs', []) for r in results):
+            unique = []
+            for finding in run.get('results', []):
+                key = self._finding_key(finding)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(finding)
+            merged['runs'].append({**run, 'results': unique})
+        return merged
+
+    def _run_scan(self, base_command, target, project_name=None, target_name=None, output_file=None,
+                  severity_threshold=None, shard=False):
+        """
+        Run a Snyk CLI scan and parse its JSON output.
+        :param base_command: Snyk command for the scan type, e.g. SAST_COMMAND.
         :param target: Path to the project or list of changed files to be scanned.
+        :param project_name: Upload the results to the Snyk Web UI under this project name.
+        :param target_name: Target name for the uploaded results.
         :param output_file: Path to save the JSON file output.
+        :param severity_threshold: Only report issues of this severity or higher (low, medium, high).
+        :param shard: Split long changed-file lists across parallel snyk processes (SARIF output only).
         :return: Scan results in JSON format.
         """
         try:
-            logger.info("----------------trigger_sast_scan Started-----------------")
-            if isinstance(target, str):
-                # Scan the entire project
-                command = ['snyk', 'code', 'test','--json', target]
-            elif isinstance(target, list):
-                flag_changed_files = [f"--file={file}" for file in target]
-                command = ['snyk', 'code', 'test', '--json'] + flag_changed_files
-            if project_name!=None:
-                command.append(f"--report")
-                command.append(f"--project-name={project_name}")
-                if target_name!=None:
-                    command.append(f"--target-name={target_name}")  
-            # else:
-                # raise ValueError("Invalid target for scan. Must be a string (project path) or list (changed files).")
-            logger.info(f"Running Command - {command}")
+            if severity_threshold is not None:
+                base_command = (*base_command, f"--severity-threshold={severity_threshold}")
+            # Report mode uploads a single project, so it always needs one invocation
+            if shard and isinstance(target, list) and len(target) > SHARD_THRESHOLD and project_name is None:
+                scan_results = self._run_sharded_scan(base_command, target)
+                if output_file is not None:
+                    self.save_results_to_json(scan_results, output_file)
+                return scan_results
+            # Scan the entire project or only the changed files
+            target_args = [target] if isinstance(target, str) else [f"--file={file}" for file in target]
+            extras = []
+            if project_name is not None:
+                extras = ['--report', f"--project-name={project_name}"] + ([f"--target-name={target_name}"] if target_name else [])
+            command = [*base_command, *target_args, *extras]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Running Command - {command}")
 
-            result = subprocess.run(command, capture_output=True, text=True)
+            if output_file is None:
+                result = subprocess.run(command, capture_output=True)
+            else:
+                # snyk writes the results file itself, so it does not need to be re-serialized afterwards.
+                # The file is still read back and parsed in full below.
+                with open(output_file, 'wb') as f:
+                    result = subprocess.run(command, stdout=f, stderr=subprocess.PIPE)
             #logger.info(f" result:{result}")
 
             if result.returncode == 0:
@@ -84,65 +251,39 @@ class SnykScanner:
                 logger.error("CLI scan failed. No supported projects detected.")
             else:
                 logger.error(f"CLI scan failed with unexpected error code: {result.returncode}")
-            scan_results = json.loads(result.stdout)
-            logger.info("----------------trigger_sast_scan Ended-----------------")
+            if output_file is None:
+                scan_results = _json_loads(result.stdout)
+            else:
+                scan_results = _json_loads(Path(output_file).read_bytes())
             return scan_results
         except subprocess.CalledProcessError as e:
             logger.error(f"Error running Snyk CLI: {e}")
             raise
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing JSON output: {e}")
-            logger.info("----------------trigger_sast_scan Ended-----------------")
             raise
 
-    def trigger_sca_scan(self, target, project_name=None, target_name=None):
+    def trigger_sast_scan(self, target, project_name=None, target_name=None, output_file=None, severity_threshold=None):
         """
         Trigger SAST scan using Snyk CLI.
         :param target: Path to the project or list of changed files to be scanned.
         :param output_file: Path to save the JSON file output.
+        :param severity_threshold: Only report issues of this severity or higher (low, medium, high).
         :return: Scan results in JSON format.
         """
-        try:
-            logger.info("----------------trigger_sca_scan Started-----------------")
-            if isinstance(target, str):
-                # Scan the entire project
-                command = ['snyk', 'test','--json', target]
-            elif isinstance(target, list):
-                flag_changed_files = [f"--file={file}" for file in target]
-                command = ['snyk', 'test', '--json'] + flag_changed_files
-            if project_name!=None:
-                command.append(f"--report")
-                command.append(f"--project-name={project_name}")
-                if target_name!=None:
-                    command.append(f"--target-name={target_name}")  
-            # else:
-                # raise ValueError("Invalid target for scan. Must be a string (project path) or list (changed files).")
-            logger.info(f"Running Command - {command}")
-
-            result = subprocess.run(command, capture_output=True, text=True)
-            #logger.info(f" result:{result}")
+        return self._run_scan(SAST_COMMAND, target, project_name, target_name,
+                              output_file, severity_threshold, shard=True)
 
-            if result.returncode == 0:
-                logger.info("CLI scan completed successfully. No vulnerabilities found.")
-            elif result.returncode == 1:
-                logger.warning("CLI scan completed. Vulnerabilities found.")
-            elif result.returncode == 2:
-                logger.error("CLI scan failed. Failure, try to re-run the command.")
-            elif result.returncode == 3:
-                logger.error("CLI scan failed. No supported projects detected.")
-            else:
-                logger.error(f"CLI scan failed with unexpected error code: {result.returncode}")
-            scan_results = json.loads(result.stdout)
-            logger.info("----------------trigger_sca_scan Ended-----------------")
-            return scan_results
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error running Snyk CLI: {e}")
-            logger.info("----------------trigger_sca_scan Ended-----------------")
-            raise
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON output: {e}")
-            logger.info("----------------trigger_sca_scan Ended-----------------")
-            raise
+    def trigger_sca_scan(self, target, project_name=None, target_name=None, output_file=None, severity_threshold=None):
+        """
+        Trigger SCA scan using Snyk CLI.
+        :param target: Path to the project or list of changed files to be scanned.
+        :param output_file: Path to save the JSON file output.
+        :param severity_threshold: Only report issues of this severity or higher (low, medium, high).
+        :return: Scan results in JSON format.
+        """
+        return self._run_scan(SCA_COMMAND, target, project_name, target_name,
+                              output_file, severity_threshold)
 
     def get_changed_files(self, repo_path, base_branch, pr_branch):
         """
@@ -154,26 +295,29 @@ class SnykScanner:
         """
         try:
             
-            logger.info("----------------get_changed_files Started-----------------")
             repo = Repo(repo_path)
-            # Fetch the latest changes from the remote repository
-            origin = repo.remotes.origin
-            origin.fetch()
+            # Fetch only the two branch heads. Depth and blob filtering are only kept for clones that
+            # are already shallow or partial, so a full workspace clone is never converted into one.
+            fetch_options = []
+            if repo.git.rev_parse('--is-shallow-repository') == 'true':
+                fetch_options.append('--depth=1')
+            if repo.git.config('--get', 'remote.origin.partialclonefilter', with_exceptions=False):
+                fetch_options.append('--filter=blob:none')
+            refspecs = [f"+{branch}:refs/remotes/origin/{branch}" for branch in (base_branch, pr_branch)]
+            repo.git.fetch(*fetch_options, 'origin', *refspecs)
             
             # Get the commit hashes for the branch heads
-            base_commit = origin.refs[base_branch].commit
-            compare_commit = origin.refs[pr_branch].commit
+            base_commit = repo.commit(f'origin/{base_branch}')
+            compare_commit = repo.commit(f'origin/{pr_branch}')
             
-            # Perform the diff between the branches
-            diff_index = base_commit.diff(compare_commit)
-            changed_files = [item.a_path for item in diff_index]
+            # Perform the diff between the branches (no rename detection, it would pull blobs)
+            changed_files = repo.git.diff('--name-only', '--no-renames', base_commit.hexsha, compare_commit.hexsha).splitlines()
             logger.info(f"Found {len(changed_files)} changed files between {base_branch} and {pr_branch}.")
-            logger.info(f"Changed Files: {changed_files}")
-            logger.info("----------------get_changed_files Ended----------------")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Changed Files: {changed_files}")
             return changed_files
         except Exception as e:
             logger.error(f"Error getting changed files: {e}")
-            logger.info("----------------get_changed_files Ended----------------")
             raise
         
     @staticmethod
@@ -183,25 +327,17 @@ class SnykScanner:
         :param scan_results: Scan results in JSON format.
         :return: Dictionary summarizing severities.
         """
-        severity_counts = {'low': 0, 'medium': 0, 'high': 0}
         try:
-            logger.info("----------------summarize_severities Started-----------------")
-            for run in scan_results.get('runs', []):
-                for result in run.get('results', []):
-                    level = result.get("level", "")
-                    if level in ['note', 'info'] :
-                        severity_counts["low"] += 1
-                    elif level == 'warning':
-                        severity_counts["medium"] += 1
-                    else:
-                        severity_counts["high"] += 1
+            counts = Counter(SEVERITY_MAP.get(vuln.get('severity'), 'high')
+                             for vuln in scan_results.get('vulnerabilities', ()))
+            counts.update(LEVEL_MAP.get(result.get('level', ''), 'high')
+                          for run in scan_results.get('runs', ()) for result in run.get('results', ()))
+            severity_counts = {'low': counts['low'], 'medium': counts['medium'], 'high': counts['high']}
             logger.info(f"Severity summary: {severity_counts}")
             severity_counts['scan_time'] = scan_results.get('scan_time', 0)  # Include scan time in summary
-            logger.info("----------------summarize_severities Ended-----------------")
             return severity_counts
         except Exception as e:
             logger.error(f"Error summarizing severities: {e}")
-            logger.info("----------------summarize_severities Ended-----------------")
             raise
 
     @staticmethod
@@ -212,44 +348,43 @@ class SnykScanner:
         :param file_path: Path to save the JSON file.
         """
         try:
-            logger.info("----------------save_results_to_json Started-----------------")
-            with open(file_path, 'w') as f:
-                json.dump(results, f, indent=4)
+            Path(file_path).write_bytes(_json_dumps(results) + b"\n")
             logger.info(f"Scan results saved to {file_path}.")
-            logger.info("----------------save_results_to_json Ended-----------------")
         except Exception as e:
             logger.error(f"Error saving scan results to {file_path}: {e}")
-            logger.info("----------------save_results_to_json Ended-----------------")
             raise
 
     @staticmethod
-    def convert_json_to_html(json_file, html_file):
+    def convert_results_to_html(scan_results, severity_summary, html_file):
         """
-        Convert JSON scan results to HTML using snyk-to-html.
-        :param json_file: Path to the JSON file.
+        Render parsed scan results as an HTML report.
+        :param scan_results: Scan results in JSON format.
+        :param severity_summary: Severity summary of the same results, from summarize_severities.
         :param html_file: Path to save the HTML file.
         """
         try:
-            logger.info("----------------convert_json_to_html Started-----------------")
-            logger.info(f"JSON File PATH: {json_file}")
-            logger.info(f"HTML File PATH: {html_file}")
-            result = subprocess.run(['snyk-to-html', '-i', json_file, '-a'], capture_output=True, text=True)
-            if result.returncode == 0:
-                print("Command estdoutxecuted successfully.")
-                # print("Output HTML content:")
-                # print(result.)  # Print the captured standard output (HTML content)
-            else:
-                print("Command failed with return code:", result.returncode)
-                print("Error output:")
-                print(result.stderr) 
-            result.check_returncode()
-            logger.info(f"Converted JSON results to HTML file at {html_file}")
-            logger.info("----------------convert_json_to_html Ended-----------------")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error converting JSON to HTML: {e}")
-            logger.info("----------------convert_json_to_html Ended-----------------")
+            findings = [(SEVERITY_MAP.get(vuln.get('severity'), 'high'), vuln.get('id'),
+                         "@".join(str(part) for part in (vuln.get('packageName'), vuln.get('version')) if part is not None),
+                         vuln.get('title'))
+                        for vuln in scan_results.get('vulnerabilities', ())]
+            for run in scan_results.get('runs', ()):
+                for result in run.get('results', ()):
+                    _, uri, line, _ = SnykScanner._finding_key(result)
+                    location = f"{uri}:{line}" if uri is not None and line is not None else uri
+                    findings.append((LEVEL_MAP.get(result.get('level', ''), 'high'), result.get('ruleId'),
+                                     location, result.get('message', {}).get('text')))
+            rows = io.StringIO()
+            for finding in findings:
+                rows.write("<tr>" + "".join(f"<td>{html.escape('' if field is None else str(field))}</td>"
+                                            for field in finding) + "</tr>\n")
+            report = HTML_REPORT_TEMPLATE.substitute(high=severity_summary['high'], medium=severity_summary['medium'],
+                                                     low=severity_summary['low'], rows=rows.getvalue())
+            Path(html_file).write_text(report, encoding='utf-8')
+            logger.info(f"Converted scan results to HTML file at {html_file}")
+        except Exception as e:
+            logger.error(f"Error converting scan results to HTML: {e}")
             raise
-    
+
     @staticmethod
     def evaluate_severity_summary(severity_summary):
         """
@@ -257,14 +392,11 @@ class SnykScanner:
         :param severity_summary: Severity summary dictionary.
         :return: Boolean indicating whether pipeline should pass or fail.
         """
-        logger.info("----------------evaluate_severity_summary Started-----------------")
         if severity_summary.get('high', 0) > 0:
             logger.error("High severity issues found. Pipeline will fail.")
-            logger.info("----------------evaluate_severity_summary Ended-----------------")
             return False
         else:
             logger.info("No high severity issues found. Pipeline will pass.")
-            logger.info("----------------evaluate_severity_summary Ended-----------------")
             return True
 
 def load_config(config_file):
@@ -284,16 +416,18 @@ def load_config(config_file):
 
 def main():
     logger.info("----------------Main started-----------------")  
-    if not os.path.exists("outputs"):
-        os.mkdir("outputs")
-    scan_summary_file_path = './outputs/severity_summary.json'
-    scan_json_file_path = "./outputs/scan_results.json"
-    scan_html_file_path = "./outputs/scan_results.html"
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    scan_summary_file_path = OUTPUT_DIR / "severity_summary.json"
     
     parser = argparse.ArgumentParser(description="Snyk SAST Scanner")
     parser.add_argument('--scan-for-push', action='store_true', help="Trigger SAST scan using Snyk CLI")
     parser.add_argument('--scan-for-pr', action='store_true', help="Trigger SAST scan on changed files in a PR branch")
-    parser.add_argument('--report', action='store_true', help="Upload results to Snyk Web UI")
+    parser.add_argument('--sca', action='store_true', help="Also trigger SCA scan in parallel with the SAST scan")
+    parser.add_argument('--html', action='store_true', help="Also write an HTML report for each scan")
+    # --report needs the unfiltered results, --gate-only filters them and writes no files
+    result_mode = parser.add_mutually_exclusive_group()
+    result_mode.add_argument('--report', action='store_true', help="Upload results to Snyk Web UI")
+    result_mode.add_argument('--gate-only', action='store_true', help="Only check for high severity issues, without writing result or summary files")
     parser.add_argument('--target-name', help="Upload results to Snyk Web UI")
     parser.add_argument('--base-branch', help="Base branch of the PR")
     parser.add_argument('--pr-branch', help="PR branch")
@@ -324,27 +458,51 @@ def main():
         return
 
     scanner = SnykScanner()
-    execution_time = 0
     if args.scan_for_push:
-        if not args.report:
-            start_time = time.time()
-            scan_results = scanner.trigger_sast_scan(target)
-            # logger.info(f" scanned result:{scan_results}")
-            end_time = time.time()
-            execution_time = end_time - start_time
-            logger.info(f"Snyk scan execution time: {execution_time:.2f} seconds")
+        scans = {'sast': scanner.trigger_sast_scan}
+        if args.sca:
+            scans['sca'] = scanner.trigger_sca_scan
+        # A SAST-only run keeps the original scan_results.* names, combined runs prefix them with the scan type
+        file_prefixes = {scan_type: f"{scan_type}_" if len(scans) > 1 else "" for scan_type in scans}
+        scan_json_file_paths = {scan_type: OUTPUT_DIR / f"{prefix}scan_results.json" for scan_type, prefix in file_prefixes.items()}
+        scan_html_file_paths = {scan_type: OUTPUT_DIR / f"{prefix}scan_results.html" for scan_type, prefix in file_prefixes.items()}
+        if args.report:
+            scan_kwargs = {'project_name': project_path}
+        elif args.gate_only:
+            # Nothing but the high severity gate reads the results, so let snyk drop the rest
+            scan_kwargs = {'severity_threshold': 'high'}
         else:
-            start_time = time.time()
-            scan_results= scanner.trigger_sast_scan(project_name=project_path) #, target_name=target_name)   
-            end_time = time.time()
-            execution_time = end_time - start_time
-            logger.info(f"Snyk scan execution time: {execution_time:.2f} seconds") 
-        if scan_results:
-            severity_summary = scanner.summarize_severities(scan_results)
-            scan_summary = {"execution_time": execution_time, "summary": severity_summary}
-            scanner.save_results_to_json(scan_results, scan_json_file_path)
-            #scanner.convert_json_to_html(scan_json_file_path, scan_html_file_path)
-            scanner.save_results_to_json(scan_summary, scan_summary_file_path)
+            scan_kwargs = {}
+
+        # SAST and SCA scans are independent CLI invocations, run them side by side
+        all_results = {}
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            futures = {executor.submit(scan, target, output_file=None if args.gate_only else scan_json_file_paths[scan_type],
+                                       **scan_kwargs): scan_type
+                       for scan_type, scan in scans.items()}
+            for future in as_completed(futures):
+                scan_type = futures[future]
+                all_results[scan_type] = future.result()
+                logger.info(f"Snyk {scan_type} scan finished after {time.time() - start_time:.2f} seconds")
+        end_time = time.time()
+        execution_time = end_time - start_time
+        logger.info(f"Snyk scan execution time: {execution_time:.2f} seconds")
+
+        severity_summary = {'low': 0, 'medium': 0, 'high': 0, 'scan_time': 0}
+        scan_summaries = {}
+        for scan_type, scan_results in all_results.items():
+            if not scan_results:
+                continue
+            scan_summaries[scan_type] = scanner.summarize_severities(scan_results)
+            for severity in severity_summary:
+                severity_summary[severity] += scan_summaries[scan_type][severity]
+            if args.html and not args.gate_only:
+                scanner.convert_results_to_html(scan_results, scan_summaries[scan_type], scan_html_file_paths[scan_type])
+        if scan_summaries:
+            if not args.gate_only:
+                scan_summary = {"execution_time": execution_time, "summary": severity_summary, "scans": scan_summaries}
+                scanner.save_results_to_json(scan_summary, scan_summary_file_path)
             if not scanner.evaluate_severity_summary(severity_summary):
                 sys.exit(1)  # Fail pipeline
 
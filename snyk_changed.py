@@ -6,11 +6,16 @@ import logging
 from git import Repo
 import sys
 import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Changed-file lists longer than this are split across parallel snyk processes
+SHARD_THRESHOLD = 16
+
 class SnykScanner: 
     
     @staticmethod
@@ -47,6 +52,62 @@ class SnykScanner:
              logger.info("----------------check_snyk_token Ended-----------------")
              raise
 
+    @staticmethod
+    def _run_snyk_chunk(base_command, files):
+        """
+        Run a single snyk invocation for a chunk of changed files.
+        :param base_command: Snyk command without the file flags.
+        :param files: List of changed files to be scanned.
+        :return: Scan results in JSON format.
+        :raises subprocess.CalledProcessError: If the chunk was not scanned (exit code other than 0 or 1).
+        """
+        command = base_command + [f"--file={file}" for file in files]
+        logger.info(f"Running Command - {command}")
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode not in (0, 1):
+            # A failed chunk has no findings in its output, merging it would hide unscanned files
+            logger.error(f"CLI scan failed for chunk with error code: {result.returncode}")
+            raise subprocess.CalledProcessError(result.returncode, command, result.stdout, result.stderr)
+        return json.loads(result.stdout)
+
+    @staticmethod
+    def _finding_key(result):
+        """
+        Identify a SARIF finding by its rule and first location.
+        """
+        location = (result.get('locations') or [{}])[0].get('physicalLocation', {})
+        region = location.get('region', {})
+        return (result.get('ruleId'), location.get('artifactLocation', {}).get('uri'),
+                region.get('startLine'), region.get('startColumn'))
+
+    def _run_sharded_scan(self, base_command, files):
+        """
+        Split the changed files into chunks and scan them with parallel snyk processes.
+        :param base_command: Snyk command without the file flags.
+        :param files: List of changed files to be scanned.
+        :return: Merged scan results in JSON format.
+        """
+        shard_count = min(os.cpu_count() or 1, -(-len(files) // SHARD_THRESHOLD))
+        shard_size = -(-len(files) // shard_count)
+        shards = [files[i:i + shard_size] for i in range(0, len(files), shard_size)]
+        logger.info(f"Splitting {len(files)} changed files into {len(shards)} shards.")
+        # Each worker only waits on its own snyk process, so threads are enough here
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(lambda shard: self._run_snyk_chunk(base_command, shard), shards))
+
+        merged = dict(results[0])
+        merged['runs'] = []
+        seen = set()
+        for run in itertools.chain.from_iterable(r.get('runs', []) for r in results):
+            unique = []
+            for finding in run.get('results', []):
+                key = self._finding_key(finding)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(finding)
+            merged['runs'].append({**run, 'results': unique})
+        return merged
+
     def trigger_sast_scan(self, target, project_name=None, target_name=None):
         """
         Trigger SAST scan using Snyk CLI.
@@ -56,6 +117,11 @@ class SnykScanner:
         """
         try:
             logger.info("----------------trigger_sast_scan Started-----------------")
+            # Report mode uploads a single project, so it always needs one invocation
+            if isinstance(target, list) and len(target) > SHARD_THRESHOLD and project_name is None:
+                scan_results = self._run_sharded_scan(['snyk', 'code', 'test', '--json'], target)
+                logger.info("----------------trigger_sast_scan Ended-----------------")
+                return scan_results
             if isinstance(target, str):
                 # Scan the entire project
                 command = ['snyk', 'code', 'test','--json', target]
@@ -108,17 +174,22 @@ class SnykScanner:
             
             logger.info("----------------get_changed_files Started-----------------")
             repo = Repo(repo_path)
-            # Fetch the latest changes from the remote repository
-            origin = repo.remotes.origin
-            origin.fetch()
+            # Fetch only the two branch heads. Depth and blob filtering are only kept for clones that
+            # are already shallow or partial, so a full workspace clone is never converted into one.
+            fetch_options = []
+            if repo.git.rev_parse('--is-shallow-repository') == 'true':
+                fetch_options.append('--depth=1')
+            if repo.git.config('--get', 'remote.origin.partialclonefilter', with_exceptions=False):
+                fetch_options.append('--filter=blob:none')
+            refspecs = [f"+{branch}:refs/remotes/origin/{branch}" for branch in (base_branch, pr_branch)]
+            repo.git.fetch(*fetch_options, 'origin', *refspecs)
             
             # Get the commit hashes for the branch heads
-            base_commit = origin.refs[base_branch].commit
-            compare_commit = origin.refs[pr_branch].commit
+            base_commit = repo.commit(f'origin/{base_branch}')
+            compare_commit = repo.commit(f'origin/{pr_branch}')
             
-            # Perform the diff between the branches
-            diff_index = base_commit.diff(compare_commit)
-            changed_files = [item.a_path for item in diff_index]
+            # Perform the diff between the branches (no rename detection, it would pull blobs)
+            changed_files = repo.git.diff('--name-only', '--no-renames', base_commit.hexsha, compare_commit.hexsha).splitlines()
             logger.info(f"Found {len(changed_files)} changed files between {base_branch} and {pr_branch}.")
             logger.info(f"Changed Files: {changed_files}")
             logger.info("----------------get_changed_files Ended----------------")
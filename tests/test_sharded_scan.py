@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import snyk
+    import snyk_changed
+except ImportError as e:  # GitPython is needed to import the scan scripts
+    raise unittest.SkipTest(f"scan scripts not importable: {e}")
+
+
+def sarif_finding(uri, line=1, rule_id='rule'):
+    return {'ruleId': rule_id, 'level': 'error',
+            'locations': [{'physicalLocation': {'artifactLocation': {'uri': uri}, 'region': {'startLine': line}}}]}
+
+
+def fake_snyk(failing_file=None):
+    """
+    Build a subprocess.run replacement that reports one finding per scanned file,
+    plus one finding on common.py that every chunk repeats.
+    """
+    def run(command, **kwargs):
+        files = [arg[len('--file='):] for arg in command if arg.startswith('--file=')]
+        if failing_file in files:
+            return subprocess.CompletedProcess(command, 2, json.dumps({'ok': False, 'error': 'boom'}), '')
+        results = [sarif_finding(file) for file in files] + [sarif_finding('common.py')]
+        return subprocess.CompletedProcess(command, 1, json.dumps({'runs': [{'results': results}]}), '')
+    return run
+
+
+class ShardedScanTest(unittest.TestCase):
+    modules = (snyk, snyk_changed)
+    files = [f"file{i}.py" for i in range(5)]
+
+    def setUp(self):
+        patchers = [mock.patch.object(os, 'cpu_count', return_value=4)]
+        patchers += [mock.patch.object(module, 'SHARD_THRESHOLD', 2) for module in self.modules]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_merges_chunks_and_deduplicates_findings(self):
+        for module in self.modules:
+            with self.subTest(module=module.__name__), \
+                    mock.patch.object(subprocess, 'run', side_effect=fake_snyk()) as run:
+                scan_results = module.SnykScanner().trigger_sast_scan(self.files)
+                self.assertEqual(run.call_count, 3)
+                self.assertEqual(len(scan_results['runs']), 3)
+                uris = [module.SnykScanner._finding_key(finding)[1]
+                        for scan_run in scan_results['runs'] for finding in scan_run['results']]
+                self.assertEqual(sorted(uris), sorted(self.files + ['common.py']))
+
+    def test_failed_chunk_raises(self):
+        for module in self.modules:
+            with self.subTest(module=module.__name__), \
+                    mock.patch.object(subprocess, 'run', side_effect=fake_snyk(failing_file='file2.py')):
+                with self.assertRaises(subprocess.CalledProcessError):
+                    module.SnykScanner().trigger_sast_scan(self.files)
+
+    def test_report_mode_runs_single_invocation(self):
+        for module in self.modules:
+            with self.subTest(module=module.__name__), \
+                    mock.patch.object(subprocess, 'run', side_effect=fake_snyk()) as run:
+                module.SnykScanner().trigger_sast_scan(self.files, project_name='Ekart')
+                self.assertEqual(run.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()